@@ -0,0 +1,253 @@
+"""Minify the path data of the world map (geoip/html/world.svg).
+
+Each d attribute is re-encoded losslessly at the source precision: for every
+point the shorter of an absolute or relative command is used, repeated
+commands are left implicit, redundant closing points are dropped and numbers
+are written without trailing/leading zeros or needless separators.
+Zero-length segments and subpaths without area are removed. Unused
+data-iso3/data-name attributes are stripped (the page only reads data-iso2;
+names come from countries.yaml).
+
+With --tolerance, rings are first simplified with Ramer-Douglas-Peucker:
+vertices closer than the tolerance (in map units) to the simplified outline
+are dropped. With --precision, coordinates are rounded to that many decimals.
+Both are lossy, so they are opt-in.
+
+Usage: python tools/minify_map.py [--precision N] [--tolerance T] [src.svg] [dst.svg]
+(defaults: geoip/html/world.svg rewritten in place at 2 decimals, no
+simplification)
+"""
+
+import argparse
+import io
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import List, Tuple
+
+DEFAULT_SVG = Path(__file__).resolve().parent.parent / "geoip" / "html" / "world.svg"
+
+# Coordinates are handled as integers in units of 10**-PRECISION so relative
+# offsets never accumulate float error.
+PRECISION = 2
+
+Point = Tuple[int, int]
+Subpath = Tuple[List[Point], bool]  # (points, closed)
+
+_PATH_TOKEN_RE = re.compile(r"[MmLlZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+SVG_NS = "http://www.w3.org/2000/svg"
+_PATH_TAG = f"{{{SVG_NS}}}path"
+_UNUSED_ATTRS = ("data-iso3", "data-name")
+
+
+def parse_path(d: str, scale: int) -> List[Subpath]:
+    """Parse M/L/Z path data (absolute or relative) into integer subpaths."""
+    subpaths: List[Subpath] = []
+    points: List[Point] = []
+    cmd = ""
+    cur = start = (0, 0)
+    pending: List[int] = []
+
+    for tok in _PATH_TOKEN_RE.findall(d):
+        if tok in "MmLl":
+            cmd = tok
+            continue
+        if tok in "Zz":
+            if points:
+                subpaths.append((points, True))
+            points = []
+            cur = start
+            continue
+        if not cmd:
+            raise ValueError(f"path data must start with a command: {d[:20]!r}")
+        pending.append(round(float(tok) * scale))
+        if len(pending) < 2:
+            continue
+        x, y = pending
+        pending = []
+        if cmd in "ml":
+            x, y = cur[0] + x, cur[1] + y
+        if cmd in "Mm":
+            if points:
+                subpaths.append((points, False))
+            points = []
+            start = (x, y)
+            cmd = "L" if cmd == "M" else "l"
+        points.append((x, y))
+        cur = (x, y)
+
+    if pending:
+        raise ValueError(f"odd number of coordinates in path: {d[:20]!r}")
+    if points:
+        subpaths.append((points, False))
+    return subpaths
+
+
+def drop_degenerate(subpaths: List[Subpath]) -> List[Subpath]:
+    """Remove repeated consecutive points and subpaths that enclose no area
+    (closed rings with fewer than 3 distinct points, single-point lines)."""
+    out: List[Subpath] = []
+    for points, closed in subpaths:
+        points = [p for i, p in enumerate(points) if i == 0 or p != points[i - 1]]
+        if len(set(points)) >= (3 if closed else 2):
+            out.append((points, closed))
+    return out
+
+
+def simplify_points(points: List[Point], tolerance: float) -> List[Point]:
+    """Ramer-Douglas-Peucker on a polyline (iterative, endpoints kept)."""
+    if len(points) < 3 or tolerance <= 0:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    tol2 = tolerance * tolerance
+    while stack:
+        first, last = stack.pop()
+        ax, ay = points[first]
+        bx, by = points[last]
+        dx, dy = bx - ax, by - ay
+        seg2 = dx * dx + dy * dy
+        best, best_d2 = 0, tol2
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if seg2:
+                cross = dx * (py - ay) - dy * (px - ax)
+                d2 = cross * cross / seg2
+            else:  # closed ring: first == last
+                d2 = (px - ax) ** 2 + (py - ay) ** 2
+            if d2 > best_d2:
+                best, best_d2 = i, d2
+        if best:
+            keep[best] = True
+            stack.append((first, best))
+            stack.append((best, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def simplify_path(subpaths: List[Subpath], tolerance: float) -> List[Subpath]:
+    """Simplify each subpath; rings that would degenerate are kept as is."""
+    out: List[Subpath] = []
+    for points, closed in subpaths:
+        if closed:
+            ring = points if points[-1] == points[0] else points + [points[0]]
+            simple = simplify_points(ring, tolerance)[:-1]
+            out.append((simple if len(simple) >= 3 else points, True))
+        else:
+            out.append((simplify_points(points, tolerance), False))
+    return out
+
+
+def format_number(value: int, scale: int) -> str:
+    sign = "-" if value < 0 else ""
+    whole, frac = divmod(abs(value), scale)
+    text = str(whole)
+    if frac:
+        digits = str(frac).rjust(len(str(scale)) - 1, "0").rstrip("0")
+        text = ("" if whole == 0 else text) + "." + digits
+    return sign + text
+
+
+def join_numbers(prev: str, nums: List[str]) -> str:
+    """Concatenate numbers after prev, adding a separator only when needed."""
+    out = []
+    for num in nums:
+        if prev and prev[-1] not in "MmLlZz" and not (
+            num[0] == "-" or (num[0] == "." and "." in prev)
+        ):
+            out.append(",")
+        out.append(num)
+        prev = num
+    return "".join(out)
+
+
+def encode_path(subpaths: List[Subpath], scale: int) -> str:
+    out: List[str] = []
+    last = ""  # last emitted token (number or command), for separators
+    implicit = ""  # command a bare coordinate pair would continue
+    cur = (0, 0)
+
+    for points, closed in subpaths:
+        if closed:
+            while len(points) > 1 and points[-1] == points[0]:
+                points = points[:-1]  # Z draws the closing segment
+        start = points[0]
+        for i, (x, y) in enumerate(points):
+            absolute = [format_number(x, scale), format_number(y, scale)]
+            relative = [format_number(x - cur[0], scale), format_number(y - cur[1], scale)]
+            options = [("M", absolute), ("m", relative)] if i == 0 else [("L", absolute), ("l", relative)]
+
+            best = ""
+            best_cmd = ""
+            best_nums: List[str] = []
+            for cmd, nums in options:
+                if i > 0 and cmd == implicit:
+                    text = join_numbers(last, nums)
+                else:
+                    text = cmd + join_numbers(cmd, nums)
+                if not best or len(text) < len(best):
+                    best, best_cmd, best_nums = text, cmd, nums
+            out.append(best)
+            last = best_nums[-1]
+            implicit = {"M": "L", "m": "l"}.get(best_cmd, best_cmd)
+            cur = (x, y)
+        if closed:
+            out.append("Z")
+            last = "Z"
+            implicit = ""
+            cur = start
+    return "".join(out)
+
+
+def minify_path(d: str, precision: int = PRECISION, tolerance: float = 0.0) -> str:
+    scale = 10 ** precision
+    subpaths = drop_degenerate(parse_path(d, scale))
+    if tolerance > 0:
+        subpaths = simplify_path(subpaths, tolerance * scale)
+    return encode_path(subpaths, scale)
+
+
+def minify_svg(svg: str, precision: int = PRECISION, tolerance: float = 0.0) -> str:
+    """Rewrite every <path> of an SVG document; other markup is kept as is."""
+    ET.register_namespace("", SVG_NS)
+    root = None
+    for _, el in ET.iterparse(io.StringIO(svg), events=("end",)):
+        root = el
+        if el.tag != _PATH_TAG:
+            continue
+        for attr in _UNUSED_ATTRS:
+            el.attrib.pop(attr, None)
+        d = el.get("d")
+        if d is not None:
+            el.set("d", minify_path(d, precision, tolerance))
+    if root is None:
+        raise ValueError("empty SVG document")
+    out = ET.tostring(root, encoding="unicode", short_empty_elements=True)
+    return out.replace(" />", "/>") + "\n"
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Minify the world map path data.")
+    parser.add_argument("src", nargs="?", type=Path, default=DEFAULT_SVG)
+    parser.add_argument("dst", nargs="?", type=Path)
+    parser.add_argument(
+        "--precision", type=int, default=PRECISION,
+        help=f"decimals kept in coordinates (default: {PRECISION})",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.0,
+        help="Ramer-Douglas-Peucker tolerance in map units (default: 0, lossless)",
+    )
+    args = parser.parse_args(argv[1:])
+    dst = args.dst or args.src
+
+    before = args.src.read_text(encoding="utf-8")
+    after = minify_svg(before, precision=args.precision, tolerance=args.tolerance)
+    dst.write_text(after, encoding="utf-8")
+    print(f"{args.src} -> {dst}: {len(before)} -> {len(after)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))